@@ -24,8 +24,13 @@ Structure
 from dataclasses import dataclass
 from typing import Literal, Optional
 
+# Output saving modes, shared by the output menu, view and view models
+TEMPORARY_LAYER_MODE = "Temporary layer"
+TO_FILE_MODE = "To file"
+OUTPUT_SAVING_MODES = (TEMPORARY_LAYER_MODE, TO_FILE_MODE)
 
-@dataclass
+
+@dataclass(slots=True)
 class InputFilesParams:
     """
     Parameters for reading input files.
@@ -42,7 +47,7 @@ class InputFilesParams:
     controls_file_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AdjustmentParams:
     """
     Parameters controlling the network adjustment computation.
@@ -68,7 +73,7 @@ class AdjustmentParams:
     free_adjustment_tuning_constants: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ReportParams:
     """
     Parameters for report generation and export.
@@ -85,7 +90,7 @@ class ReportParams:
     report_path: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputParams:
     """
     Parameters for saving output data.
@@ -98,5 +103,5 @@ class OutputParams:
         Path to the output file or name of the temporary layer, depending on the mode.
     """
 
-    output_saving_mode: Literal["Temporary layer", "To file"] = "Temporary layer"
+    output_saving_mode: Literal["Temporary layer", "To file"] = TEMPORARY_LAYER_MODE
     output_path: str = ""
@@ -36,12 +36,13 @@ from qgis.PyQt.QtGui import QIcon, QPixmap
 
 ICONS_DIR = Path(__file__).parent.joinpath("png")
 
-# Icons ================================================================================
-main_icon = QIcon(str(ICONS_DIR.joinpath("QNet.png")))
-
 # Pixmaps ==============================================================================
 main_pixmap = QPixmap(str(ICONS_DIR.joinpath("QNet.png")))
 qnet_error_pixmap = QPixmap(str(ICONS_DIR.joinpath("QNetError.png")))
 qnet_warning_pixmap = QPixmap(str(ICONS_DIR.joinpath("QNetWarning.png")))
 qnet_question_pixmap = QPixmap(str(ICONS_DIR.joinpath("QNetQuestion.png")))
 qnet_information_pixmap = QPixmap(str(ICONS_DIR.joinpath("QNetInformation.png")))
+
+# Icons ================================================================================
+# Built from the already loaded pixmap, so QNet.png is read from disk only once
+main_icon = QIcon(main_pixmap)
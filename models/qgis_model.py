@@ -4,10 +4,10 @@
 # Licensed under the GNU General Public License v3.0.
 # Full text of the license can be found in the LICENSE file in the repository.
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
-import pandas as pd
 import pysurv as ps
 from pysurv.data import Controls
 from qgis.core import (
@@ -18,7 +18,6 @@ from qgis.core import (
     QgsFields,
     QgsGeometry,
     QgsPoint,
-    QgsPointXY,
     QgsProject,
     QgsVectorFileWriter,
     QgsVectorLayer,
@@ -29,6 +28,33 @@ from ..dto.data_transfer_objects import OutputParams
 from .results.output_result import OutputResult
 from .results.result import Result, ResultStatus
 
+# QGIS field types keyed by numpy dtype kind; other kinds are stored as strings
+_FIELD_TYPES_BY_DTYPE_KIND = {
+    "i": QVariant.Int,
+    "u": QVariant.Int,
+    "f": QVariant.Double,
+    "b": QVariant.Bool,
+    "M": QVariant.DateTime,
+}
+
+
+@lru_cache(maxsize=16)
+def _build_fields(schema: Tuple[Tuple[str, str], ...]) -> QgsFields:
+    """
+    Build the layer fields template for a dataset schema.
+
+    The schema is a tuple of (column name, dtype kind) pairs. Results are cached, so
+    the returned object is a shared template and must be copied before use.
+    """
+    fields = QgsFields()
+    # Create index field
+    fields.append(QgsField("id", QVariant.String))
+    # Create attributes field
+    for col, kind in schema:
+        field_type = _FIELD_TYPES_BY_DTYPE_KIND.get(kind, QVariant.String)
+        fields.append(QgsField(col, field_type))
+    return fields
+
 
 class QGisModel:
     """
@@ -204,15 +230,11 @@ class QGisModel:
 
     def _create_layer_fields(self) -> None:
         """Create and add attribute fields to the QGIS layer based on dataset columns."""
-        fields = QgsFields()
-        # Create index field
-        id_field = QgsField("id", QVariant.String)
-        fields.append(id_field)
-        # Create attributes field
-        for col in self.points_data.columns:
-            dtype = self.get_field_dtype(self.points_data[col])
-            field = QgsField(col, dtype)
-            fields.append(field)
+        schema = tuple(
+            (col, self.points_data[col].dtype.kind) for col in self.points_data.columns
+        )
+        # Copy the cached template so each layer owns its fields
+        fields = QgsFields(_build_fields(schema))
 
         self.data_provider.addAttributes(fields)
         self.layer.updateFields()
@@ -220,35 +242,30 @@ class QGisModel:
     def _create_layer_features(self) -> None:
         """Create and add point features to the QGIS layer using dataset geometry data."""
         feats = []
+        columns = self.points_data.columns
+
+        # Unbox the dataset column-wise into native Python values once
+        ids = [str(index) for index in self.points_data.index]
+        attr_cols = [self.points_data[col].tolist() for col in columns]
+        xs = self.points_data["x"].tolist()
+        ys = self.points_data["y"].tolist()
+        zs = self.points_data["z"].tolist() if "z" in columns else None
+
+        # Bind frequently used callables to locals to avoid attribute lookups per row
+        append = feats.append
 
-        for row in self.points_data.itertuples():
+        for i, point_id in enumerate(ids):
             feat = QgsFeature()
-            x = getattr(row, "x")
-            y = getattr(row, "y")
-            z = getattr(row, "z", None)
-
-            geom = (
-                QgsGeometry.fromPoint(QgsPoint(x, y, z))
-                if z is not None
-                else QgsGeometry.fromPointXY(QgsPointXY(x, y))
+            x = xs[i]
+            y = ys[i]
+
+            # QgsGeometry takes ownership of the point, so no intermediate clone is made
+            geom = QgsGeometry(
+                QgsPoint(x, y, zs[i]) if zs is not None else QgsPoint(x, y)
             )
             feat.setGeometry(geom)
-            feat.setAttributes(list(row))
-            feats.append(feat)
+            feat.setAttributes([point_id] + [col[i] for col in attr_cols])
+            append(feat)
 
         self.data_provider.addFeatures(feats)
         self.layer.updateExtents()
-
-    @staticmethod
-    def get_field_dtype(column: pd.Series) -> QVariant:
-        """Map a columns dtype to the corresponding QGIS QVariant type."""
-        dtype = column.dtype
-        if pd.api.types.is_integer_dtype(dtype):
-            return QVariant.Int
-        if pd.api.types.is_float_dtype(dtype):
-            return QVariant.Double
-        if pd.api.types.is_bool_dtype(dtype):
-            return QVariant.Bool
-        if pd.api.types.is_datetime64_any_dtype(dtype):
-            return QVariant.DateTime
-        return QVariant.String
@@ -10,6 +10,6 @@ from .result import Result
 class AdjustmentResult(Result):
     """Result class for adjustment operations."""
 
-    _success_title = "Adjustment Complete"
-    _warning_title = "Adjustment Warning"
-    _error_title = "Adjustment Error"
+    __slots__ = ()
+
+    _titles = ("Adjustment Complete", "Adjustment Warning", "Adjustment Error")
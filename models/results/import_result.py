@@ -10,6 +10,6 @@ from .result import Result
 class ImportResult(Result):
     """Result class for import file operations."""
 
-    _success_title = "Import Files Complete"
-    _warning_title = "Import Files Warning"
-    _error_title = "Import Files Error"
+    __slots__ = ()
+
+    _titles = ("Import Files Complete", "Import Files Warning", "Import Files Error")
@@ -10,6 +10,6 @@ from .result import Result
 class OutputResult(Result):
     """Result class for QGIS layer output creation operations."""
 
-    _success_title = "Output Created"
-    _warning_title = "Output Warning"
-    _error_title = "Output Error"
+    __slots__ = ()
+
+    _titles = ("Output Created", "Output Warning", "Output Error")
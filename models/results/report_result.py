@@ -10,6 +10,6 @@ from .result import Result
 class ReportResult(Result):
     """Result class for report export operations."""
 
-    _success_title = "Report Exported"
-    _warning_title = "Report Warning"
-    _error_title = "Report Error"
+    __slots__ = ()
+
+    _titles = ("Report Exported", "Report Warning", "Report Error")
@@ -5,30 +5,36 @@
 # Full text of the license can be found in the LICENSE file in the repository.
 
 from dataclasses import dataclass
-from enum import Enum
-from typing import Any, ClassVar, Iterator, Optional
+from enum import IntEnum
+from typing import Any, ClassVar, Iterator, Optional, Tuple
 
 
-class ResultStatus(Enum):
+class ResultStatus(IntEnum):
     """
     Enumeration defining possible statuses for a `Result` object.
 
+    Integer values keep status comparisons and status-keyed lookups at the C level.
+
     Attributes
     ----------
-    - SUCCESS : str
+    - SUCCESS : int
         Indicates the operation completed successfully.
-    - WARNING : str
+    - WARNING : int
         Indicates the operation completed with warnings or non-critical issues.
-    - ERROR : str
+    - ERROR : int
         Indicates the operation failed due to an error.
     """
 
-    SUCCESS = "success"
-    WARNING = "warning"
-    ERROR = "error"
+    SUCCESS = 0
+    WARNING = 1
+    ERROR = 2
+
+
+# Fallback titles for success, warning and error results
+DEFAULT_TITLES = ("QNET Success", "QNET Warning", "QNET Error")
 
 
-@dataclass
+@dataclass(slots=True)
 class Result:
     """
     Base class for returning operation results used across QNET models.
@@ -51,12 +57,12 @@ class Result:
 
     Class Variables
     ---------------
-    - _success_title : str
-        Default title for success results (to be overridden by subclasses).
-    - _warning_title : str
-        Default title for warning results (to be overridden by subclasses).
-    - _error_title : str
-        Default title for error results (to be overridden by subclasses).
+    - _titles : Tuple[str, str, str]
+        Default titles for success, warning and error results (to be overridden by
+        subclasses).
+    - _resolved_titles : Tuple[str, str, str]
+        Default titles with empty entries replaced by `DEFAULT_TITLES`, indexed by
+        `ResultStatus`. Resolved once when a subclass is created.
 
     Methods
     -------
@@ -73,60 +79,40 @@ class Result:
     message: str
     output: Optional[Any] = None
 
-    # ClassVars to be overridden by subclasses to provide default titles for different result statuses
-    _success_title: ClassVar[str] = ""
-    _warning_title: ClassVar[str] = ""
-    _error_title: ClassVar[str] = ""
+    # ClassVar to be overridden by subclasses to provide default titles for different result statuses
+    _titles: ClassVar[Tuple[str, str, str]] = ("", "", "")
+    _resolved_titles: ClassVar[Tuple[str, str, str]] = DEFAULT_TITLES
+
+    def __init_subclass__(cls) -> None:
+        """Resolve the default titles of the subclass once when it is created."""
+        cls._resolved_titles = tuple(
+            title or default for title, default in zip(cls._titles, DEFAULT_TITLES)
+        )
 
     def __iter__(self) -> Iterator[Any]:
         """Enables unpacking the object: status, title, message, output = Result()."""
-        yield self.status
-        yield self.title
-        yield self.message
-        yield self.output
-
-    @classmethod
-    def _get_title(cls, status: ResultStatus) -> str:
-        """Return the appropriate title based on the given status."""
-        titles = {
-            ResultStatus.SUCCESS: cls._success_title,
-            ResultStatus.WARNING: cls._warning_title,
-            ResultStatus.ERROR: cls._error_title,
-        }
-        return titles.get(status, "")
+        return iter((self.status, self.title, self.message, self.output))
 
     @classmethod
     def success(
         cls, message: str, output: Optional[Any] = None, title: Optional[str] = None
     ) -> "Result":
         """Return a SUCCESS Result with a given message and optional output and custom title."""
-        result_title = (
-            title if title is not None else cls._get_title(ResultStatus.SUCCESS)
-        )
-        if not result_title:
-            result_title = "QNET Success"
-        return cls(ResultStatus.SUCCESS, result_title, message, output=output)
+        status = ResultStatus.SUCCESS
+        return cls(status, title or cls._resolved_titles[status], message, output)
 
     @classmethod
     def warning(
         cls, message: str, output: Optional[Any] = None, title: Optional[str] = None
     ) -> "Result":
         """Return a WARNING Result with a given message and optional output and custom title."""
-        result_title = (
-            title if title is not None else cls._get_title(ResultStatus.WARNING)
-        )
-        if not result_title:
-            result_title = "QNET Warning"
-        return cls(ResultStatus.WARNING, result_title, message, output=output)
+        status = ResultStatus.WARNING
+        return cls(status, title or cls._resolved_titles[status], message, output)
 
     @classmethod
     def error(
         cls, message: str, output: Optional[Any] = None, title: Optional[str] = None
     ) -> "Result":
         """Return an ERROR Result with a given message and optional output and custom title."""
-        result_title = (
-            title if title is not None else cls._get_title(ResultStatus.ERROR)
-        )
-        if not result_title:
-            result_title = "QNET Error"
-        return cls(ResultStatus.ERROR, result_title, message, output=output)
+        status = ResultStatus.ERROR
+        return cls(status, title or cls._resolved_titles[status], message, output)
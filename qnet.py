@@ -4,16 +4,14 @@
 # Licensed under the GNU General Public License v3.0.
 # Full text of the license can be found in the LICENSE file in the repository.
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from qgis.core import *
-from qgis.gui import *
 from qgis.PyQt.QtWidgets import QAction
 
 from .icons.icons import main_icon
-from .models.main_model import MainModel
-from .view_models.main_view_model import MainViewModel
-from .views.main_view import MainView
+
+if TYPE_CHECKING:
+    from qgis.gui import QgisInterface
 
 
 class QNet:
@@ -68,6 +66,11 @@ class QNet:
 
     def run(self) -> None:
         """Instantiates core components and run the main dialog of the plugin."""
+        # Imported on first use to keep QGIS startup free of the adjustment stack
+        from .models.main_model import MainModel
+        from .view_models.main_view_model import MainViewModel
+        from .views.main_view import MainView
+
         model = MainModel()
         view_model = MainViewModel(model)
         view = MainView(view_model)
@@ -40,7 +40,7 @@ class QNetBackgroundTask(QgsTask):
         self._results: List[Result] = []
         
     def steps(self) -> List[TaskStep]:
-        """Returns task's steps."""
+        """Returns task's steps to be executed. Skipped steps are not registered."""
         return self._steps
         
     def results(self) -> List[Result]:
@@ -54,10 +54,12 @@ class QNetBackgroundTask(QgsTask):
         prepare_func: Optional[Callable[[], None]] = None,
         emit_signal: bool = True,
     ) -> "QNetBackgroundTask":
-        """Add step to the task's steps."""
+        """Add step to the task's steps. Steps with the skip flag are not registered."""
+        if skip:
+            return self
+
         step = TaskStep(
             model_func=model_func,
-            skip=skip,
             prepare_func=prepare_func,
             emit_signal=emit_signal,
         )
@@ -67,23 +69,27 @@ class QNetBackgroundTask(QgsTask):
 
     def run(self) -> bool:
         """Performs the task's operation when started by the QGIS task manager."""
-        for step in self.steps():
+        # Bind frequently used attributes to locals to avoid lookups per step
+        is_canceled = self.isCanceled
+        append_result = self._results.append
+        success = ResultStatus.SUCCESS
+        error = ResultStatus.ERROR
 
-            if self.isCanceled():
-                return False
+        for step in self._steps:
 
-            if step.skip:
-                continue
+            if is_canceled():
+                return False
 
-            if callable(step.prepare_func):
+            if step.prepare_func is not None:
                 step.prepare_func()
 
             result = step.model_func()
+            status = result.status
 
-            if result.status != ResultStatus.SUCCESS or step.emit_signal:
-                self._results.append(result)
+            if status != success or step.emit_signal:
+                append_result(result)
                 
-            if result.status == ResultStatus.ERROR:
+            if status == error:
                 return False
 
         return True
@@ -10,22 +10,20 @@ from dataclasses import dataclass
 from ...models.results.result import Result
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskStep:
     """
     Represents a single step to be executed by a QNetBackgroundTask.
 
     A TaskStep holds a reference to a model function that will be executed as part of 
     the task. Optionally, it can also reference a preparation function that runs just
-    before the model function. Additionaly, defines flags indicate whether to skip 
-    execution of this step and whether to emit a signal upon successful completion.
+    before the model function. Additionaly, defines a flag indicating whether to emit
+    a signal upon successful completion.
 
     Attributes
     ----------
     - model_func : Callable[[], Result]
         The model function that will be executed in this step.
-    - skip : bool, optional
-        If True, this step is skipped during task execution. Defaults to False.
     - prepare_func : Callable[[], None], optional
         An optional function to run before model_func to set up any preconditions.
     - emit_signal : bool, optional
@@ -34,6 +32,5 @@ class TaskStep:
     """
     
     model_func: Callable[[], Result]
-    skip: bool = False
     prepare_func: Optional[Callable[[], None]] = None
     emit_signal: bool = True
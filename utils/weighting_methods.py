@@ -34,59 +34,95 @@ parameter signatures.
 """
 
 from inspect import signature, unwrap
-from typing import Dict, Tuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
 
 from pysurv.adjustment import robust
 
-WEIGHTING_METHODS = {
-    "Ordinary": "ordinary",
-    "Weighted": "weighted",
-    "Huber": "huber",
-    "Slope": "slope",
-    "Hampel": "hampel",
-    "Danish": "danish",
-    "Epanechnikov": "epanechnikov",
-    "Tukey": "tukey",
-    "Jacobi": "jacobi",
-    "Exponential": "exponential",
-    "Choice Rule of Alternative": "cra",
-    "Error Function": "error_func",
-    "Cauchy": "cauchy",
-    "T distribution": "t",
-    "Bell Curve": "chain_bell",
-    "Chain Curve": "chain",
-    "Andrews": "andrews",
-    "Wave": "wave",
-    "Half-wave": "half_wave",
-    "Wigner": "wigner",
-    "Ellipse Curve": "ellipse_curve",
-    "Trim": "trim",
-}
+# Read-only mapping of UI method labels to PySurv weighting method names
+WEIGHTING_METHODS = MappingProxyType(
+    {
+        "Ordinary": "ordinary",
+        "Weighted": "weighted",
+        "Huber": "huber",
+        "Slope": "slope",
+        "Hampel": "hampel",
+        "Danish": "danish",
+        "Epanechnikov": "epanechnikov",
+        "Tukey": "tukey",
+        "Jacobi": "jacobi",
+        "Exponential": "exponential",
+        "Choice Rule of Alternative": "cra",
+        "Error Function": "error_func",
+        "Cauchy": "cauchy",
+        "T distribution": "t",
+        "Bell Curve": "chain_bell",
+        "Chain Curve": "chain",
+        "Andrews": "andrews",
+        "Wave": "wave",
+        "Half-wave": "half_wave",
+        "Wigner": "wigner",
+        "Ellipse Curve": "ellipse_curve",
+        "Trim": "trim",
+    }
+)
+
+# Method labels in display order, used to populate the combo boxes
+WEIGHTING_METHOD_LABELS = tuple(WEIGHTING_METHODS)
+
+# Reverse mapping of WEIGHTING_METHODS used to look up UI labels by PySurv names
+_NAME_TO_LABEL = MappingProxyType(
+    {name: label for label, name in WEIGHTING_METHODS.items()}
+)
 
 
 def get_method_label_from_name(method_name: str) -> str:
     """Return the UI method label for a given PySurv weighting method name."""
-    for label, name in WEIGHTING_METHODS.items():
-        if name == method_name:
-            return label
-    return ""
+    return _NAME_TO_LABEL.get(method_name, "")
 
 
 def get_method_name_and_tuning_constants(
     method_label: str,
-) -> Tuple[str, Dict[str, float]]:
-    """Return the weighting method name and its tuning constants for a given label."""
-    method_name = WEIGHTING_METHODS.get(method_label)
+) -> Tuple[Optional[str], Dict[str, float]]:
+    """
+    Return the weighting method name and its tuning constants for a given label.
+
+    The returned tuning constants dictionary is a copy and may be modified freely. An
+    unknown label gives no method name and no tuning constants.
+    """
+    method_name, tuning_constants = _TUNING_CONSTANTS_CACHE.get(
+        method_label, _UNKNOWN_METHOD
+    )
+    return method_name, dict(tuning_constants)
+
+
+def _get_default_tuning_constants(method_name: str) -> Dict[str, float]:
+    """Return default tuning constants from the PySurv weighting function signature."""
     func = getattr(robust, method_name, None)
 
     if not func:
-        return method_name, dict()
+        return dict()
 
     wrapped_func = unwrap(func)
     sig = signature(wrapped_func)
 
-    return method_name, {
+    return {
         key: value.default
         for key, value in sig.parameters.items()
         if isinstance(value.default, (int, float))
     }
+
+
+# Lookup fallback for unknown labels, shared so no default is built on each call
+_UNKNOWN_METHOD: Tuple[None, Mapping[str, float]] = (None, MappingProxyType({}))
+
+# Method names and default tuning constants keyed by method label, resolved once from
+# WEIGHTING_METHODS and read-only, so every lookup table derives from a single source
+_TUNING_CONSTANTS_CACHE: Mapping[str, Tuple[str, Mapping[str, float]]] = (
+    MappingProxyType(
+        {
+            label: (name, MappingProxyType(_get_default_tuning_constants(name)))
+            for label, name in WEIGHTING_METHODS.items()
+        }
+    )
+)
@@ -39,18 +39,26 @@ class InputFilesViewModel(BaseViewModelSection):
         self.params = InputFilesParams()
 
     def reset_state(self) -> None:
-        """Reset all input file parameters to defaults and emit signals."""
+        """Reset all input file parameters to defaults and emit signals on change."""
+        previous_params = self.params
         self.params = InputFilesParams()
-        self._emit_measurements_file_path_changed()
-        self._emit_controls_file_path_changed()
+
+        if previous_params.measurements_file_path != self.params.measurements_file_path:
+            self._emit_measurements_file_path_changed()
+        if previous_params.controls_file_path != self.params.controls_file_path:
+            self._emit_controls_file_path_changed()
 
     def update_measurements_file_path(self, measurements_file_path: str) -> None:
         """Update the measurements file path and emit the change signal."""
+        if measurements_file_path == self.params.measurements_file_path:
+            return
         self.params.measurements_file_path = measurements_file_path
         self._emit_measurements_file_path_changed()
 
     def update_controls_file_path(self, controls_file_path: str) -> None:
         """Update the controls file path and emit the change signal."""
+        if controls_file_path == self.params.controls_file_path:
+            return
         self.params.controls_file_path = controls_file_path
         self._emit_controls_file_path_changed()
 
@@ -5,17 +5,18 @@
 # Full text of the license can be found in the LICENSE file in the repository.
 
 from functools import partial
-from pathlib import Path
+from os.path import dirname, join
 from typing import Callable, List, Optional
 
 from pysurv import Project
 from qgis.core import QgsApplication
-from qgis.PyQt.QtCore import pyqtSignal
+from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot
 
-from ..dto.data_transfer_objects import OutputParams
+from ..dto.data_transfer_objects import TEMPORARY_LAYER_MODE, TO_FILE_MODE, OutputParams
 from ..models.main_model import MainModel
 from ..models.pysurv_model import PySurvModel
 from ..models.qgis_model import QGisModel
+from ..models.results.output_result import OutputResult
 from ..models.results.result import Result, ResultStatus
 from ..utils.tasks.qnet_background_task import QNetBackgroundTask
 from .base_view_models import BaseViewModel
@@ -98,6 +99,21 @@ class MainViewModel(BaseViewModel):
         self.pysurv_model = model.pysurv_model if model else PySurvModel()
         self.qgis_model = model.qgis_model if model else QGisModel()
 
+        self._task_manager = QgsApplication.taskManager()
+
+        # Result signals keyed by result status
+        self._result_signals = {
+            ResultStatus.SUCCESS: self.success_occurred,
+            ResultStatus.WARNING: self.warning_occurred,
+            ResultStatus.ERROR: self.error_occurred,
+        }
+
+        # Output handlers keyed by output saving mode
+        self._output_handlers = {
+            TEMPORARY_LAYER_MODE: self.qgis_model.create_output_layer,
+            TO_FILE_MODE: self.qgis_model.create_output_file,
+        }
+
         self.input_files_view_model = input_files_view_model or InputFilesViewModel()
         self.weighting_methods_view_model = (
             weighting_methods_view_model or WeightingMethodsViewModel()
@@ -108,7 +124,6 @@ class MainViewModel(BaseViewModel):
     def perform_adjustment(self) -> None:
         """Perform the network adjustment and export results."""
         pysurv_task = QNetBackgroundTask()
-        task_manager = QgsApplication.taskManager()
 
         if self._adjustment_in_progress():
             self.adjustment_in_progress.emit()
@@ -132,14 +147,30 @@ class MainViewModel(BaseViewModel):
             emit_signal=True,
         )
 
-        pysurv_task_results_handler = lambda: self._handle_pysurv_results(
-            pysurv_task.results()
-        )
+        pysurv_task.taskCompleted.connect(self._on_pysurv_task_finished)
+        pysurv_task.taskTerminated.connect(self._on_pysurv_task_finished)
 
-        pysurv_task.taskCompleted.connect(pysurv_task_results_handler)
-        pysurv_task.taskTerminated.connect(pysurv_task_results_handler)
+        self._task_manager.addTask(pysurv_task)
 
-        task_manager.addTask(pysurv_task)
+    @pyqtSlot()
+    def _on_pysurv_task_finished(self) -> None:
+        """Handle results of the completed or terminated PySurv task."""
+        task = self.sender()
+        self._disconnect_task(task, self._on_pysurv_task_finished)
+        self._handle_pysurv_results(task.results())
+
+    @pyqtSlot()
+    def _on_qgis_task_finished(self) -> None:
+        """Emit results signals of the completed or terminated QGIS task."""
+        task = self.sender()
+        self._disconnect_task(task, self._on_qgis_task_finished)
+        self._emit_results_signals(task.results())
+
+    @staticmethod
+    def _disconnect_task(task: QNetBackgroundTask, slot: Callable[[], None]) -> None:
+        """Disconnect the signals of a finished task from the given slot."""
+        task.taskCompleted.disconnect(slot)
+        task.taskTerminated.disconnect(slot)
 
     def _handle_pysurv_results(self, results: List[Result]) -> None:
         """Emit PySurv results signals and run QGIS task if no error occured."""
@@ -151,59 +182,59 @@ class MainViewModel(BaseViewModel):
     def _run_qgis_task(self) -> bool:
         """Run the QGIS task to generate Vector Point layer."""
         qgis_task = QNetBackgroundTask()
-        task_manager = QgsApplication.taskManager()
 
         if self._adjustment_in_progress():
             self.adjustment_in_progress.emit()
             return  # Prevent multiple concurrent adjustments
 
+        output_handler = self._get_output_saving_mode_handler()
+        if output_handler is None:
+            self._emit_result_signal(
+                OutputResult.error(
+                    "Unknown output saving mode: "
+                    f"{self.output_view_model.params.output_saving_mode}."
+                )
+            )
+            return
+
         qgis_task.add_step(
             partial(
-                self._get_output_saving_mode_handler(),
+                output_handler,
                 self.pysurv_model.project,
                 self.output_view_model.params,
             ),
             emit_signal=False,
         )
 
-        qgis_task_results_handler = lambda: self._emit_results_signals(
-            qgis_task.results()
-        )
-
-        qgis_task.taskCompleted.connect(qgis_task_results_handler)
-        qgis_task.taskTerminated.connect(qgis_task_results_handler)
+        qgis_task.taskCompleted.connect(self._on_qgis_task_finished)
+        qgis_task.taskTerminated.connect(self._on_qgis_task_finished)
 
-        task_manager.addTask(qgis_task)
+        self._task_manager.addTask(qgis_task)
 
     def _prepare_report_path(self) -> None:
         """Set default report path (control points directory) if were not specified."""
         if self.report_view_model.params.report_path:
             return
 
-        controls_file_dir = Path(
+        controls_file_dir = dirname(
             self.input_files_view_model.params.controls_file_path
-        ).parent
-
-        self.report_view_model.update_report_path(
-            str(controls_file_dir.joinpath("report.txt"))
         )
 
+        self.report_view_model.update_report_path(join(controls_file_dir, "report.txt"))
+
     def _get_output_saving_mode_handler(
         self,
     ) -> Optional[Callable[[Project, OutputParams], Result]]:
         """Return output handler method based on the selected output saving mode."""
-        output_methods = {
-            "Temporary layer": self.qgis_model.create_output_layer,
-            "To file": self.qgis_model.create_output_file,
-        }
-        return output_methods.get(self.output_view_model.params.output_saving_mode)
+        return self._output_handlers.get(
+            self.output_view_model.params.output_saving_mode
+        )
     
     def _adjustment_in_progress(self) -> bool:
         """Return True if adjustment calculations is already in progress."""
-        task_manager = QgsApplication.taskManager()
         return any(
             isinstance(task, QNetBackgroundTask)
-            for task in task_manager.activeTasks()
+            for task in self._task_manager.activeTasks()
         )
 
     def _emit_results_signals(self, results: List[Result]) -> bool:
@@ -211,16 +242,9 @@ class MainViewModel(BaseViewModel):
         for result in results:
             self._emit_result_signal(result)
 
-            if result.status == ResultStatus.ERROR:
-                return False
-        return True
+        # Tasks stop on the first error, so it can only be the last result
+        return not results or results[-1].status != ResultStatus.ERROR
 
     def _emit_result_signal(self, result: Result) -> None:
         """Emit signal corresponding to the result status."""
-        signals = {
-            ResultStatus.SUCCESS: self.success_occurred,
-            ResultStatus.WARNING: self.warning_occurred,
-            ResultStatus.ERROR: self.error_occurred,
-        }
-        signal = signals.get(result.status)
-        signal.emit(result.title, result.message)
+        self._result_signals[result.status].emit(result.title, result.message)
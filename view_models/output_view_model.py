@@ -4,11 +4,13 @@
 # Licensed under the GNU General Public License v3.0.
 # Full text of the license can be found in the LICENSE file in the repository.
 
-from functools import partial
-
 from qgis.PyQt.QtCore import pyqtSignal
 
-from ..dto.data_transfer_objects import OutputParams
+from ..dto.data_transfer_objects import (
+    TEMPORARY_LAYER_MODE,
+    TO_FILE_MODE,
+    OutputParams,
+)
 from .base_view_models import BaseViewModelSection
 
 
@@ -49,20 +51,15 @@ class OutputViewModel(BaseViewModelSection):
 
     def update_output_saving_mode(self, output_saving_mode: str) -> None:
         """Update the output saving mode and emit the change signal."""
-        output_handlers = {
-            "Temporary layer": partial(
-                self._handle_temporary_layer_output_saving_mode, output_saving_mode
-            ),
-            "To file": partial(
-                self._handle_to_file_output_saving_mode, output_saving_mode
-            ),
-        }
-        output_handler = output_handlers.get(output_saving_mode)
-        if output_handler:
-            output_handler()
+        if output_saving_mode == TEMPORARY_LAYER_MODE:
+            self._handle_temporary_layer_output_saving_mode(output_saving_mode)
+        elif output_saving_mode == TO_FILE_MODE:
+            self._handle_to_file_output_saving_mode(output_saving_mode)
 
     def update_output_path(self, output_path: str) -> None:
         """Update the output path and emit the change signal."""
+        if output_path == self.params.output_path:
+            return
         self.params.output_path = output_path
         self._emit_output_path_changed()
 
@@ -70,7 +67,7 @@ class OutputViewModel(BaseViewModelSection):
         self, output_saving_mode: str
     ) -> None:
         """Handle output mode when 'Temporary layer' is selected."""
-        if self.params.output_saving_mode == "Temporary layer":
+        if self.params.output_saving_mode == TEMPORARY_LAYER_MODE:
             return
         self.params.output_saving_mode = output_saving_mode
         self._emit_output_saving_mode_changed()
@@ -49,13 +49,17 @@ class ReportViewModel(BaseViewModelSection):
         self._emit_export_report_changed()
         self._emit_report_path_changed()
 
-    def switch_report(self, state: int) -> None:
-        """Toggle report export on or off based on the given state."""
-        self.params.export_report = state == 2
+    def switch_report(self, enabled: bool) -> None:
+        """Toggle report export on or off based on the given checked state."""
+        if enabled == self.params.export_report:
+            return
+        self.params.export_report = enabled
         self._emit_export_report_changed()
 
     def update_report_path(self, report_path: str) -> None:
         """Update the report file path and emit a change signal."""
+        if report_path == self.params.report_path:
+            return
         self.params.report_path = report_path
         self._emit_report_path_changed()
 
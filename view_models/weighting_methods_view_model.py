@@ -52,94 +52,85 @@ class WeightingMethodsViewModel(BaseViewModelSection):
         super().__init__()
         self.params = AdjustmentParams()
 
+        # Emitters called on reset, bound once (they only reference self)
+        self._reset_emitters: Tuple[Callable[[], None], ...] = (
+            self._emit_observation_weighting_method_changed,
+            self._emit_observation_tuning_constants_changed,
+            self._emit_free_adjustment_switched,
+            self._emit_free_adjustment_weighting_method_changed,
+            self._emit_free_adjustment_tuning_constants_changed,
+        )
+
     def reset_state(self) -> None:
         """Reset all weighting method parameters to defaults and emit signals."""
         self.params = AdjustmentParams()
-        self._emit_observation_weighting_method_changed()
-        self._emit_observation_tuning_constants_changed()
-        self._emit_free_adjustment_switched()
-        self._emit_free_adjustment_weighting_method_changed()
-        self._emit_free_adjustment_tuning_constants_changed()
+        for emit in self._reset_emitters:
+            emit()
 
     def update_observation_weighting_method(self, method_label: str) -> None:
         """Update the observation weighting method and emit change signals."""
-        self._update_weighting_method(
-            method_label,
-            "observation_weighting_method",
-            "observation_tuning_constants",
-            self._emit_observation_weighting_method_changed,
-            self._emit_observation_tuning_constants_changed,
+        method_name, tuning_constants = get_method_name_and_tuning_constants(
+            method_label
         )
 
+        self.params.observation_weighting_method = method_name
+        self._emit_observation_weighting_method_changed()
+
+        self.params.observation_tuning_constants = tuning_constants or None
+        self._emit_observation_tuning_constants_changed()
+
     def update_free_adjustment_weighting_method(self, method_label: str) -> None:
         """Update the free adjustment weighting method and emit change signals."""
-        self._update_weighting_method(
-            method_label,
-            "free_adjustment_weighting_method",
-            "free_adjustment_tuning_constants",
-            self._emit_free_adjustment_weighting_method_changed,
-            self._emit_free_adjustment_tuning_constants_changed,
+        method_name, tuning_constants = get_method_name_and_tuning_constants(
+            method_label
         )
 
+        self.params.free_adjustment_weighting_method = method_name
+        self._emit_free_adjustment_weighting_method_changed()
+
+        self.params.free_adjustment_tuning_constants = tuning_constants or None
+        self._emit_free_adjustment_tuning_constants_changed()
+
     def update_observation_tuning_constants(
         self, tuning_constant_values: Tuple[float]
     ) -> None:
         """Update observation tuning constants and emit change signals."""
-        self._update_tuning_constants(
-            "observation_tuning_constants",
-            tuning_constant_values,
-            self._emit_observation_tuning_constants_changed,
-        )
+        if self._update_tuning_constants(
+            self.params.observation_tuning_constants, tuning_constant_values
+        ):
+            self._emit_observation_tuning_constants_changed()
 
     def update_free_adjustment_tuning_constants(
         self, tuning_constant_values: Tuple[float]
     ) -> None:
         """Update free adjustment tuning constants and emit change signals."""
-        self._update_tuning_constants(
-            "free_adjustment_tuning_constants",
-            tuning_constant_values,
-            self._emit_free_adjustment_tuning_constants_changed,
-        )
+        if self._update_tuning_constants(
+            self.params.free_adjustment_tuning_constants, tuning_constant_values
+        ):
+            self._emit_free_adjustment_tuning_constants_changed()
 
-    def switch_free_adjustment(self, state: int) -> None:
+    def switch_free_adjustment(self, enabled: bool) -> None:
         """Toggle free adjustment mode and emit change signal."""
-        self.params.perform_free_adjustment = state == 2
+        if enabled == self.params.perform_free_adjustment:
+            return
+        self.params.perform_free_adjustment = enabled
         self._emit_free_adjustment_switched()
 
-    def _update_weighting_method(
-        self,
-        method_label: str,
-        weighting_method_param: str,
-        tuning_constants_param: str,
-        emit_method_changed: Callable[[], None],
-        emit_tuning_constants_changed: Callable[[], None],
-    ) -> None:
-        """Update weighting method and its corresponding tuning constants."""
-        method_name, tuning_constants = get_method_name_and_tuning_constants(
-            method_label
-        )
-
-        setattr(self.params, weighting_method_param, method_name)
-        emit_method_changed()
-
-        setattr(self.params, tuning_constants_param, tuning_constants or None)
-        emit_tuning_constants_changed()
-
+    @staticmethod
     def _update_tuning_constants(
-        self,
-        tuning_constants_param: str,
+        tuning_constants: Optional[Dict[str, float]],
         tuning_constants_values: Tuple[float],
-        emit_tuning_constants_changed: Callable[[], None],
-    ) -> None:
-        """Update tuning constant values."""
-        tuning_constants = getattr(self.params, tuning_constants_param)
-
+    ) -> bool:
+        """Update tuning constant values in place. Return True if they were updated."""
         if tuning_constants is None:
-            return
+            return False
+
+        if tuple(tuning_constants.values()) == tuple(tuning_constants_values):
+            return False  # Skip if new values are the same as previous ones
 
         for key, value in zip(tuning_constants.keys(), tuning_constants_values):
             tuning_constants[key] = value
-        emit_tuning_constants_changed()
+        return True
 
     def _emit_free_adjustment_switched(self) -> None:
         """Emit free adjustment switched signal."""
@@ -147,46 +138,33 @@ class WeightingMethodsViewModel(BaseViewModelSection):
 
     def _emit_observation_weighting_method_changed(self) -> None:
         """Emit observation weighting method changed signal."""
-        self._emit_weighting_method_changed(
-            self.observation_weighting_method_changed,
-            self.params.observation_weighting_method,
+        self.observation_weighting_method_changed.emit(
+            self.params.observation_weighting_method
         )
 
     def _emit_free_adjustment_weighting_method_changed(self) -> None:
         """Emit free adjustment weighting method changed signal."""
-        self._emit_weighting_method_changed(
-            self.free_adjustment_weighting_method_changed,
-            self.params.free_adjustment_weighting_method,
+        self.free_adjustment_weighting_method_changed.emit(
+            self.params.free_adjustment_weighting_method
         )
 
-    def _emit_weighting_method_changed(
-        self, signal: Callable[[str], None], method_name: str
-    ) -> None:
-        """Emit weighting method changed signal."""
-        signal.emit(method_name)
-
     def _emit_free_adjustment_tuning_constants_changed(self) -> None:
         """Emit free adjustment tuning constants changed signal."""
-        self._emit_tuning_constants_changed(
-            self.free_adjustment_tuning_constants_changed,
-            self.params.free_adjustment_tuning_constants,
+        self.free_adjustment_tuning_constants_changed.emit(
+            self._get_tuning_constants_values(
+                self.params.free_adjustment_tuning_constants
+            )
         )
 
     def _emit_observation_tuning_constants_changed(self) -> None:
         """Emit observation tuning constants changed signal."""
-        self._emit_tuning_constants_changed(
-            self.observation_tuning_constants_changed,
-            self.params.observation_tuning_constants,
+        self.observation_tuning_constants_changed.emit(
+            self._get_tuning_constants_values(self.params.observation_tuning_constants)
         )
 
-    def _emit_tuning_constants_changed(
-        self,
-        signal: Callable[[Tuple[float, ...]], None],
+    @staticmethod
+    def _get_tuning_constants_values(
         tuning_constants: Optional[Dict[str, float]],
-    ) -> None:
-        """Emit tuning constants changed signal."""
-        signal.emit(
-            tuple(tuning_constants.values())
-            if tuning_constants is not None
-            else tuple()
-        )
+    ) -> Tuple[float, ...]:
+        """Return tuning constant values as a tuple."""
+        return tuple(tuning_constants.values()) if tuning_constants is not None else ()
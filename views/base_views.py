@@ -28,7 +28,9 @@ class BaseView(Generic[ViewModelType]):
     Properties
     ----------
     - view_model : Getter and setter for the ViewModel reference. When a ViewModel is
-        assigned, the view automatically binds widgets and signals.
+        assigned, the view automatically binds widgets and signals. A view is meant to
+        be bound to a single ViewModel: assigning a different one later does not
+        disconnect the previous ViewModel, which stays connected to the view.
     """
 
     def __init__(self) -> None:
@@ -44,13 +46,32 @@ class BaseView(Generic[ViewModelType]):
 
     @view_model.setter
     def view_model(self, view_model: Optional[ViewModelType]) -> None:
-        """Set the view model and bind widgets and signals if it's not None."""
+        """
+        Set the view model and bind widgets and signals if it's not None.
+
+        Assign a view model once. Reassigning the same one is a no-op, but assigning a
+        different one leaves the previous view model's connections in place.
+        """
+        self._bind_view_model(view_model)
+
+    def _bind_view_model(self, view_model: Optional[ViewModelType]) -> bool:
+        """
+        Store the view model and bind widgets and signals to it.
+
+        Returns True if a new, not None view model was bound. Reassigning the current
+        view model is skipped, as rebinding would duplicate signal connections. The
+        connections of a previously bound view model are not removed.
+        """
+        if view_model is self._view_model:
+            return False
+
         self._view_model = view_model
-        if self._view_model is None:
-            return
+        if view_model is None:
+            return False
 
         self.bind_widgets()
         self.bind_view_model_signals()
+        return True
 
     def bind_widgets(self) -> None:
         """Bind UI widgets to event handlers."""
@@ -80,8 +101,11 @@ class BaseViewSection(BaseView[ViewModelType]):
 
     @BaseView.view_model.setter
     def view_model(self, view_model: Optional[ViewModelType]) -> None:
-        """Set the view model and reset its state after binding if it's not None."""
-        BaseView.view_model.fset(self, view_model)
-        if not self._view_model:
-            return
-        self._view_model.reset_state()
+        """
+        Set the view model and reset its state after binding if it's not None.
+
+        Assign a view model once. Reassigning the same one is a no-op, but assigning a
+        different one leaves the previous view model's connections in place.
+        """
+        if self._bind_view_model(view_model):
+            view_model.reset_state()
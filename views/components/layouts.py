@@ -10,6 +10,7 @@ from qgis.PyQt.QtWidgets import (
     QCheckBox,
     QComboBox,
     QFormLayout,
+    QGridLayout,
     QHBoxLayout,
     QLabel,
     QLineEdit,
@@ -19,15 +20,24 @@ from qgis.PyQt.QtWidgets import (
 from .widgets import QDoubleSpinBoxList
 
 
-class FileLayout(QFormLayout):
+class FileLayout(QGridLayout):
     """
-    Standardized form layout for file input and output widgets.
+    Standardized grid layout for file input and output widgets.
 
     Provides a flexible layout for combining common file selection controls
     such as a label, optional enable/disable checkbox, line edit for path display,
-    and a button for browsing or saving files.
+    and a button for browsing or saving files. The label spans the first row and the
+    controls are placed directly in the columns of the second one, so no nested row
+    layout is needed.
     """
 
+    # Grid positions of the file row widgets
+    LABEL_ROW = 0
+    FILE_ROW = 1
+    CHECKBOX_COLUMN = 0
+    LINE_EDIT_COLUMN = 1
+    BUTTON_COLUMN = 2
+
     def __init__(
         self,
         label: Optional[QLabel] = None,
@@ -53,26 +63,25 @@ class FileLayout(QFormLayout):
             Parent widget for the layout.
         """
         super().__init__(parent)
-        self.addRow(label)
+        if label:
+            self.addWidget(label, self.LABEL_ROW, 0, 1, self.BUTTON_COLUMN + 1)
 
-        row = self._build_file_row(checkbox, line_edit, button)
-        self.addRow(row)
+        self._add_file_row(checkbox, line_edit, button)
 
-    def _build_file_row(
+    def _add_file_row(
         self,
         checkbox: Optional[QCheckBox],
         line_edit: Optional[QLineEdit],
         button: Optional[QPushButton],
-    ) -> QHBoxLayout:
-        """Build a horizontal layout row for the checkbox, line edit, and button."""
-        file_row_layout = QHBoxLayout()
+    ) -> None:
+        """Place the checkbox, line edit, and button in the columns of the file row."""
         if checkbox:
-            file_row_layout.addWidget(checkbox, stretch=0)
+            self.addWidget(checkbox, self.FILE_ROW, self.CHECKBOX_COLUMN)
         if line_edit:
-            file_row_layout.addWidget(line_edit, stretch=1)
+            self.addWidget(line_edit, self.FILE_ROW, self.LINE_EDIT_COLUMN)
         if button:
-            file_row_layout.addWidget(button, stretch=0)
-        return file_row_layout
+            self.addWidget(button, self.FILE_ROW, self.BUTTON_COLUMN)
+        self.setColumnStretch(self.LINE_EDIT_COLUMN, 1)
 
 
 class WeightingMethodLayout(QFormLayout):
@@ -4,24 +4,26 @@
 # Licensed under the GNU General Public License v3.0.
 # Full text of the license can be found in the LICENSE file in the repository.
 
-from typing import Literal
-
 from qgis.PyQt.QtWidgets import QCheckBox, QComboBox, QFileDialog, QLineEdit, QWidget
 
-
-def get_file_path_from_dialog(
-    widget: QWidget,
-    window_title: str,
-    dir: str,
-    file_filter: str,
-    mode: Literal["open", "save"],
+# Skip custom icon lookups and symlink resolution, which stat every listed entry
+# Handle both PyQt5 and PyQt6
+try:
+    _FILE_DIALOG_OPTIONS = (
+        QFileDialog.Option.DontUseCustomDirectoryIcons
+        | QFileDialog.Option.DontResolveSymlinks
+    )
+except AttributeError:
+    _FILE_DIALOG_OPTIONS = (
+        QFileDialog.DontUseCustomDirectoryIcons | QFileDialog.DontResolveSymlinks
+    )
+
+
+def open_file_dialog(
+    widget: QWidget, window_title: str, dir: str, file_filter: str
 ) -> str:
     """
-    Open a file dialog and return the selected file path.
-
-    Opens a QFileDialog in either open or save mode, based on the provided mode.
-    Returns the absolute file path selected by the user, or an empty string if
-    the dialog is cancelled or an invalid mode is specified.
+    Open a file dialog for loading a file and return the selected file path.
 
     Parameters
     ----------
@@ -33,25 +35,44 @@ def get_file_path_from_dialog(
         Initial directory path for the file dialog.
     - file_filter: str
         File type filter.
-    - mode : Literal["open", "save"]
-        Mode of the dialog — either "open" for loading files or "save" for saving output.
 
     Returns
     -------
     str
         Selected file path or an empty string if cancelled.
     """
-    window_modes = {
-        "open": QFileDialog.getOpenFileName,
-        "save": QFileDialog.getSaveFileName,
-    }
-    window_mode = window_modes.get(mode)
+    path, _ = QFileDialog.getOpenFileName(
+        widget, window_title, dir, file_filter, options=_FILE_DIALOG_OPTIONS
+    )
+    return path
 
-    if not window_mode:
-        return ""
 
-    path, _ = window_mode(widget, window_title, dir, file_filter)
-    return path if path else ""
+def save_file_dialog(
+    widget: QWidget, window_title: str, dir: str, file_filter: str
+) -> str:
+    """
+    Open a file dialog for saving a file and return the selected file path.
+
+    Parameters
+    ----------
+    - widget: QWidget
+        Parent widget for the file dialog.
+    - window_title : str
+        Title displayed on the file dialog window.
+    - dir: str
+        Initial directory path for the file dialog.
+    - file_filter: str
+        File type filter.
+
+    Returns
+    -------
+    str
+        Selected file path or an empty string if cancelled.
+    """
+    path, _ = QFileDialog.getSaveFileName(
+        widget, window_title, dir, file_filter, options=_FILE_DIALOG_OPTIONS
+    )
+    return path
 
 
 def update_line_edit(line_edit: QLineEdit, line_edit_text: str) -> None:
@@ -75,20 +96,20 @@ def update_line_edit(line_edit: QLineEdit, line_edit_text: str) -> None:
     line_edit.setText(line_edit_text)
 
 
-def update_checkbox_state(checkbox: QCheckBox, state: int) -> None:
+def update_checkbox_state(checkbox: QCheckBox, checked: bool) -> None:
     """
-    Update a checkbox to the specified check state if different from the current one.
+    Update a checkbox to the specified checked state if different from the current one.
 
     Parameters
     ----------
     - checkbox : QCheckBox
         The checkbox widget to update.
-    - state : int
-        The target check state.
+    - checked : bool
+        The target checked state.
     """
-    if state == checkbox.checkState():
+    if checked == checkbox.isChecked():
         return
-    checkbox.setCheckState(state)
+    checkbox.setChecked(checked)
 
 
 def update_combo_box_text(combo_box: QComboBox, text: str) -> None:
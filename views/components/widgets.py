@@ -4,9 +4,9 @@
 # Licensed under the GNU General Public License v3.0.
 # Full text of the license can be found in the LICENSE file in the repository.
 
-from typing import Any, Iterator, List, Optional, Tuple
+from typing import Any, Iterator, List, Optional, Sequence
 
-from qgis.PyQt.QtCore import QObject, pyqtSignal
+from qgis.PyQt.QtCore import QAbstractItemModel, QObject, pyqtSignal
 from qgis.PyQt.QtGui import QPixmap
 from qgis.PyQt.QtWidgets import (
     QAction,
@@ -17,13 +17,14 @@ from qgis.PyQt.QtWidgets import (
     QWidget,
 )
 
+from ...dto.data_transfer_objects import OUTPUT_SAVING_MODES
 from ...icons.icons import (
     main_pixmap,
     qnet_error_pixmap,
     qnet_information_pixmap,
     qnet_warning_pixmap,
 )
-from ...utils.weighting_methods import WEIGHTING_METHODS
+from ...utils.weighting_methods import WEIGHTING_METHOD_LABELS
 
 
 class QDoubleSpinBoxList(QObject):
@@ -126,19 +127,28 @@ class WeightingMethodComboBox(QComboBox):
     QComboBox for selecting a weighting method.
 
     Automatically populates itself with supported methods defined in
-    `WEIGHTING_METHODS`. Supports compatibility with both PyQt5 and PyQt6
+    `WEIGHTING_METHOD_LABELS`. Supports compatibility with both PyQt5 and PyQt6
     signal naming conventions.
 
     Signals
     -------
     - currentTextChanged: str
         Provides access to the text change signal compatible with PyQt5 and PyQt6.
+
+    Attributes
+    ----------
+    - MINIMUM_CONTENTS_LENGTH : int
+        Number of characters the combo box width is adjusted to, equal to the length
+        of the longest weighting method label so no label is elided.
     """
 
+    MINIMUM_CONTENTS_LENGTH = max(map(len, WEIGHTING_METHOD_LABELS))
+
     def __init__(
         self,
         weighting_methods: Optional[List[str]] = None,
         parent: Optional[QWidget] = None,
+        model: Optional[QAbstractItemModel] = None,
     ) -> None:
         """
         Initialize the WeightingMethodComboBox.
@@ -147,16 +157,34 @@ class WeightingMethodComboBox(QComboBox):
         ----------
         weighting_methods : List[str] [optional, default=None]
             List of weighting method names to populate the combo box. If not provided,
-            all available methods from `WEIGHTING_METHODS` will be used.
+            all available methods from `WEIGHTING_METHOD_LABELS` will be used.
         parent : QWidget, optional
             The parent widget.
+        model : QAbstractItemModel, optional
+            Already populated item model to share with another combo box. If provided,
+            `weighting_methods` is ignored and no items are created.
         """
         super().__init__(parent)
-        self._populate(
-            weighting_methods or [method for method in WEIGHTING_METHODS.keys()]
-        )
+        self._configure_size_policy()
+        if model is not None:
+            self.setModel(model)
+            return
+        self._populate(weighting_methods or WEIGHTING_METHOD_LABELS)
+
+    def _configure_size_policy(self) -> None:
+        """Size the widget by a fixed text length instead of measuring every item."""
+        # Handle both PyQt5 and PyQt6
+        try:
+            size_policy = (
+                QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+            )
+        except AttributeError:
+            size_policy = QComboBox.AdjustToMinimumContentsLengthWithIcon
 
-    def _populate(self, weighting_methods: List[str]) -> None:
+        self.setSizeAdjustPolicy(size_policy)
+        self.setMinimumContentsLength(self.MINIMUM_CONTENTS_LENGTH)
+
+    def _populate(self, weighting_methods: Sequence[str]) -> None:
         """Populate widget with weighting method names."""
         self.addItems(weighting_methods)
 
@@ -187,12 +215,8 @@ class SavingModeMenu(QMenu):
             The parent widget.
         """
         super().__init__(parent)
-        for action in self._define_output_mode_actions():
-            self.addAction(action)
-
-    def _define_output_mode_actions(self) -> Tuple[QAction]:
-        """Return a tuple of QAction objects for output modes."""
-        return (QAction("Temporary layer", self), QAction("To file", self))
+        for output_saving_mode in OUTPUT_SAVING_MODES:
+            self.addAction(QAction(output_saving_mode, self))
 
 
 class QNetMessageBox(QMessageBox):
@@ -4,11 +4,14 @@
 # Licensed under the GNU General Public License v3.0.
 # Full text of the license can be found in the LICENSE file in the repository.
 
+from os.path import dirname
 from typing import Optional
 
+from qgis.PyQt.QtCore import pyqtSlot
+
 from ..view_models.input_files_view_model import InputFilesViewModel
 from .base_views import BaseViewSection
-from .components.utils import get_file_path_from_dialog, update_line_edit
+from .components.utils import open_file_dialog, update_line_edit
 from .input_files_view_ui import InputFilesViewUI
 
 
@@ -28,6 +31,8 @@ class InputFilesView(InputFilesViewUI, BaseViewSection[InputFilesViewModel]):
         File type filter applied to the file selection dialogs.
     - view_model : Optional[InputFilesViewModel]
         Reference to the associated ViewModel managing input file paths.
+    - _last_dir : str
+        Directory of the last file selected in the dialog, used as its initial one.
     """
 
     FILE_FILTER = "CSV Files (*.csv)"
@@ -42,6 +47,7 @@ class InputFilesView(InputFilesViewUI, BaseViewSection[InputFilesViewModel]):
             Reference to the associated InputFilesViewModel.
         """
         super().__init__()
+        self._last_dir = ""
         self.view_model = view_model
 
     def bind_widgets(self) -> None:
@@ -67,10 +73,12 @@ class InputFilesView(InputFilesViewUI, BaseViewSection[InputFilesViewModel]):
             self.update_controls_line_edit
         )
 
+    @pyqtSlot(str)
     def update_measurements_line_edit(self, measurements_file_path: str) -> None:
         """Update the measurements line edit with new file path."""
         update_line_edit(self.measurements_line_edit, measurements_file_path)
 
+    @pyqtSlot(str)
     def update_controls_line_edit(self, controls_file_path: str) -> None:
         """Update the controls line edit with new file path."""
         update_line_edit(self.controls_line_edit, controls_file_path)
@@ -89,6 +97,7 @@ class InputFilesView(InputFilesViewUI, BaseViewSection[InputFilesViewModel]):
 
     def _get_file_path_from_dialog(self, window_title: str) -> str:
         """Open file dialog and return the selected path."""
-        return get_file_path_from_dialog(
-            self, window_title, "", self.FILE_FILTER, "open"
-        )
+        path = open_file_dialog(self, window_title, self._last_dir, self.FILE_FILTER)
+        if path:
+            self._last_dir = dirname(path)
+        return path
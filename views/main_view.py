@@ -7,6 +7,7 @@
 from typing import Optional
 
 from qgis.core import Qgis
+from qgis.PyQt.QtCore import pyqtSlot
 from qgis.utils import iface
 
 from ..view_models.main_view_model import MainViewModel
@@ -81,18 +82,22 @@ class MainView(MainViewUI, BaseView[MainViewModel]):
         """Execute the network adjustment calcualtions."""
         self.view_model.perform_adjustment()
 
+    @pyqtSlot(str, str)
     def display_error_message(self, error_type: str, error_message: str) -> None:
         """Display an error message box for the user."""
         QNetErrorMessageBox(error_type, error_message, parent=self)
 
+    @pyqtSlot(str, str)
     def display_warning_message(self, warning_type: str, warning_message: str) -> None:
         """Display an warning message box for the user."""
         QNetWarningMessageBox(warning_type, warning_message, parent=self)
 
+    @pyqtSlot(str, str)
     def display_info_message(self, info_type: str, info_message: str) -> None:
         """Display an information message box for the user."""
         QNetInformationMessageBox(info_type, info_message, parent=self)
 
+    @pyqtSlot()
     def display_adjustment_in_progress_message_bar(self) -> None:
         """Display an error message bar when adjustment is already in progress."""
         iface.messageBar().pushMessage(
@@ -5,11 +5,15 @@
 # Full text of the license can be found in the LICENSE file in the repository.
 
 from functools import partial
+from os.path import dirname
 from typing import Optional
 
+from qgis.PyQt.QtCore import pyqtSlot
+
+from ..dto.data_transfer_objects import TEMPORARY_LAYER_MODE, TO_FILE_MODE
 from ..view_models.output_view_model import OutputViewModel
 from .base_views import BaseViewSection
-from .components.utils import get_file_path_from_dialog, update_line_edit
+from .components.utils import save_file_dialog, update_line_edit
 from .output_view_ui import OutputViewUI
 
 
@@ -28,6 +32,8 @@ class OutputView(OutputViewUI, BaseViewSection[OutputViewModel]):
     ----------
     - FILE_FILTER : str
         File type filter used in the output file dialog.
+    - _last_dir : str
+        Directory of the last file selected in the dialog, used as its initial one.
     """
 
     FILE_FILTER = "Shapefile (*.shp)"
@@ -42,6 +48,7 @@ class OutputView(OutputViewUI, BaseViewSection[OutputViewModel]):
             Reference to the associated OutputViewModel.
         """
         super().__init__()
+        self._last_dir = ""
         self.view_model = view_model
 
     def bind_widgets(self) -> None:
@@ -60,25 +67,25 @@ class OutputView(OutputViewUI, BaseViewSection[OutputViewModel]):
         )
         self.view_model.output_path_changed.connect(self.update_output_line_edit)
 
+    @pyqtSlot(str)
     def handle_output_saving_mode(self, output_saving_mode: str) -> None:
         """Determines and run the appropriate method when the saving mode changes."""
-        output_handlers = {
-            "Temporary layer": partial(self.update_output_line_edit, ""),
-            "To file": self.update_output_line_edit_from_dialog,
-        }
-        output_handler = output_handlers.get(output_saving_mode)
-        if output_handler:
-            output_handler()
+        if output_saving_mode == TEMPORARY_LAYER_MODE:
+            self.update_output_line_edit("")
+        elif output_saving_mode == TO_FILE_MODE:
+            self.update_output_line_edit_from_dialog()
 
+    @pyqtSlot(str)
     def update_output_line_edit(self, output_path: str) -> None:
         """Update the output line edit with a new output file path."""
         update_line_edit(self.output_line_edit, output_path)
 
     def update_output_line_edit_from_dialog(self) -> None:
         """Open file dialog and return the selected path."""
-        path = get_file_path_from_dialog(
-            self, self.output_label.text()[:-1], "", self.FILE_FILTER, "save"
+        path = save_file_dialog(
+            self, self.output_label.text()[:-1], self._last_dir, self.FILE_FILTER
         )
 
         if path:
+            self._last_dir = dirname(path)
             update_line_edit(self.output_line_edit, path)
@@ -4,14 +4,15 @@
 # Licensed under the GNU General Public License v3.0.
 # Full text of the license can be found in the LICENSE file in the repository.
 
+from os.path import dirname
 from typing import Optional
 
-from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtCore import pyqtSlot
 
 from ..view_models.report_view_model import ReportViewModel
 from .base_views import BaseViewSection
 from .components.utils import (
-    get_file_path_from_dialog,
+    save_file_dialog,
     update_checkbox_state,
     update_line_edit,
 )
@@ -31,6 +32,8 @@ class ReportView(ReportViewUI, BaseViewSection[ReportViewModel]):
     ----------
     - FILE_FILTER : str
         File type filter used in the report file dialog.
+    - _last_dir : str
+        Directory of the last file selected in the dialog, used as its initial one.
     """
 
     FILE_FILTER = "Text Files (*.txt)"
@@ -45,12 +48,13 @@ class ReportView(ReportViewUI, BaseViewSection[ReportViewModel]):
             Reference to the associated ReportViewModel.
         """
         super().__init__()
+        self._last_dir = ""
         self.view_model = view_model
 
     def bind_widgets(self) -> None:
         """Bind UI widget signals to their ViewModel handlers."""
         self.report_button.clicked.connect(self._get_file_path_from_dialog)
-        self.report_checkbox.stateChanged.connect(self.view_model.switch_report)
+        self.report_checkbox.toggled.connect(self.view_model.switch_report)
         self.report_line_edit.textChanged.connect(self.view_model.update_report_path)
 
     def bind_view_model_signals(self) -> None:
@@ -58,30 +62,23 @@ class ReportView(ReportViewUI, BaseViewSection[ReportViewModel]):
         self.view_model.export_report_changed.connect(self.enable_report)
         self.view_model.report_path_changed.connect(self.update_report_line_edit)
 
+    @pyqtSlot(bool)
     def enable_report(self, enabled: bool) -> None:
         """Enable or disable exporting the report."""
-        # Handle both PyQt5 and PyQt6
-        try: 
-            checked = Qt.CheckState.Checked
-            unchecked = Qt.CheckState.Unchecked
-        except AttributeError:
-            checked = Qt.Checked
-            unchecked = Qt.Unchecked
-        
-        update_checkbox_state(
-            self.report_checkbox, checked if enabled else unchecked
-        )
+        update_checkbox_state(self.report_checkbox, enabled)
         self.report_button.setEnabled(enabled)
         self.report_line_edit.setEnabled(enabled)
 
+    @pyqtSlot(str)
     def update_report_line_edit(self, new_report_path: str) -> None:
         """Update the report line edit with new file path."""
         update_line_edit(self.report_line_edit, new_report_path)
 
     def _get_file_path_from_dialog(self) -> None:
         """Open file dialog and return the selected path."""
-        path = get_file_path_from_dialog(
-            self, self.report_label.text()[:-1], "", self.FILE_FILTER, "save"
+        path = save_file_dialog(
+            self, self.report_label.text()[:-1], self._last_dir, self.FILE_FILTER
         )
         if path:
+            self._last_dir = dirname(path)
             self.view_model.update_report_path(path)
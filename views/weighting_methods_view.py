@@ -7,6 +7,8 @@
 from itertools import zip_longest
 from typing import Optional, Tuple
 
+from qgis.PyQt.QtCore import pyqtSlot
+
 from ..utils.weighting_methods import get_method_label_from_name
 from ..view_models.weighting_methods_view_model import WeightingMethodsViewModel
 from .base_views import BaseViewSection
@@ -54,7 +56,7 @@ class WeightingMethodsView(
         self.observation_weighting_method_tuning_constants.listValueChanged.connect(
             self.view_model.update_observation_tuning_constants
         )
-        self.free_adjustment_checkbox.stateChanged.connect(
+        self.free_adjustment_checkbox.toggled.connect(
             self.view_model.switch_free_adjustment
         )
         self.free_adjustment_weighting_method_combo_box.currentTextChanged.connect(
@@ -80,12 +82,14 @@ class WeightingMethodsView(
             self.update_free_adjustment_weighting_method_tuning_constants
         )
 
+    @pyqtSlot(str)
     def update_observation_weighting_method_combo_box(self, method_name: str) -> None:
         """Update observation weighting method combo box current text."""
         self._update_weighting_method_combo_box_text(
             self.observation_weighting_method_combo_box, method_name
         )
 
+    @pyqtSlot(str)
     def update_free_adjustment_weighting_method_combo_box(
         self, method_name: str
     ) -> None:
@@ -94,12 +98,14 @@ class WeightingMethodsView(
             self.free_adjustment_weighting_method_combo_box, method_name
         )
 
+    @pyqtSlot(bool)
     def enable_free_adjustment(self, enabled: bool) -> None:
         """Enable or disable free adjustment control widgets."""
-        update_checkbox_state(self.free_adjustment_checkbox, 2 if enabled else 0)
+        update_checkbox_state(self.free_adjustment_checkbox, enabled)
         self.free_adjustment_weighting_method_combo_box.setEnabled(enabled)
         self.free_adjustment_weighting_method_tuning_constants.setEnabled(enabled)
 
+    @pyqtSlot(tuple)
     def update_observation_weighting_method_tuning_constants(
         self, tuning_constants_values: Tuple[float]
     ) -> None:
@@ -109,6 +115,7 @@ class WeightingMethodsView(
             tuning_constants_values,
         )
 
+    @pyqtSlot(tuple)
     def update_free_adjustment_weighting_method_tuning_constants(
         self, tuning_constant_values: Tuple[float]
     ) -> None:
@@ -131,11 +138,15 @@ class WeightingMethodsView(
         tuning_constants_values: Tuple[float],
     ) -> None:
         """Update value and show/hide tuning constant spin boxes."""
+        # Values come from the ViewModel, so they are not echoed back to it and the
+        # section is repainted once after all spin boxes are updated
+        self.setUpdatesEnabled(False)
         for spin_box, c in zip_longest(
             tuning_constants_list, tuning_constants_values, fillvalue=None
         ):
             if c is not None:
+                spin_box.blockSignals(True)
                 spin_box.setValue(c)
-                spin_box.show()
-            else:
-                spin_box.hide()
+                spin_box.blockSignals(False)
+            spin_box.setVisible(c is not None)
+        self.setUpdatesEnabled(True)
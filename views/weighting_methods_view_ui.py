@@ -61,7 +61,10 @@ class WeightingMethodsViewUI(BaseViewSectionUI):
             "Free adjustment weighting methods:"
         )
         self.free_adjustment_checkbox = QCheckBox()
-        self.free_adjustment_weighting_method_combo_box = WeightingMethodComboBox()
+        # Share the item model, so the method labels are created only once
+        self.free_adjustment_weighting_method_combo_box = WeightingMethodComboBox(
+            model=self.observation_weighting_method_combo_box.model()
+        )
         self.free_adjustment_weighting_method_tuning_constants = QDoubleSpinBoxList(3)
 
         self._configure_widgets()
@@ -97,7 +100,12 @@ class WeightingMethodsViewUI(BaseViewSectionUI):
 
     def _configure_tuning_constants(self, tuning_constants: QDoubleSpinBoxList) -> None:
         """Configure properties for tuning constant spin boxes."""
-        tuning_constants.setDecimals(self.TUNING_CONSTANTS_DECIMALS)
-        tuning_constants.setRange(*self.TUNING_CONSTANTS_RANGE)
-        tuning_constants.setSingleStep(self.TUNING_CONSTANTS_STEP)
-        tuning_constants.hide()
+        # Configure each spin box in one pass without emitting value changes
+        minimum, maximum = self.TUNING_CONSTANTS_RANGE
+        for spin_box in tuning_constants:
+            spin_box.blockSignals(True)
+            spin_box.setDecimals(self.TUNING_CONSTANTS_DECIMALS)
+            spin_box.setRange(minimum, maximum)
+            spin_box.setSingleStep(self.TUNING_CONSTANTS_STEP)
+            spin_box.hide()
+            spin_box.blockSignals(False)